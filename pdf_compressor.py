@@ -1,9 +1,26 @@
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from tkinter import ttk # filedialog/messagebox are imported on first use to speed up startup
 import subprocess
+import tempfile
 import os
 import sys
-import threading
+import json
+import shutil
+import glob
+import re
+from collections import deque
+
+# --- Constants ---
+# Ghostscript PDFSETTINGS presets and their descriptions, in display order
+COMPRESSION_LEVELS = (
+    ("screen", "Low Quality (72 dpi) - Max Compression"),
+    ("ebook", "Medium Quality (150 dpi) - Good for screen reading"),
+    ("printer", "High Quality (300 dpi) - Good for printing"),
+    ("prepress", "Best Quality (300 dpi, preserves color) - Minimal Compression"),
+)
+
+# Common names for the Ghostscript command-line executable on Windows
+GS_NAMES = ('gswin64c.exe', 'gswin32c.exe', 'gs.exe')
 
 # --- Core Application Class ---
 class PDFCompressorApp:
@@ -12,14 +29,44 @@ class PDFCompressorApp:
     The user can select a PDF, choose a compression level, and save the
     compressed file.
     """
-    def __init__(self, root):
+    # Ghostscript arguments that are the same for every compression run
+    _GS_STATIC_ARGS = (
+        '-sDEVICE=pdfwrite',
+        '-dCompatibilityLevel=1.4',
+        '-dNOPAUSE',
+        '-dQUIET',
+        '-dBATCH',
+    )
+    # Let Ghostscript use every core and a larger band buffer where it can
+    _GS_PERFORMANCE_ARGS = (
+        f'-dNumRenderingThreads={max(1, os.cpu_count() or 1)}',
+        '-dBufferSpace=200000000',
+    )
+    # Keeps Ghostscript from opening a console window on Windows
+    _CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+    # How often to check whether Ghostscript has finished
+    _POLL_INTERVAL_MS = 150
+    # Only the end of Ghostscript's stderr is shown when it fails
+    _STDERR_TAIL_BYTES = 16384
+    # Rough output/input size ratio per level, used to estimate progress
+    _EXPECTED_RATIO = {
+        'screen': 0.15,
+        'ebook': 0.35,
+        'printer': 0.6,
+        'prepress': 0.9,
+    }
+
+    def __init__(self, root, verbose=False):
         """
         Initializes the main application window and its widgets.
+        With verbose=True, a dialog with the size summary is also shown
+        after each successful compression.
         """
         self.root = root
+        self.verbose = verbose
         self.root.title("PDF Compressor")
-        # Increased height from 350 to 400 to prevent button cutoff
-        self.root.geometry("550x400")
+        # Increased height from 400 to 430 to make room for the summary label
+        self.root.geometry("550x430")
         self.root.resizable(False, False)
         
         # Style configuration
@@ -30,7 +77,16 @@ class PDFCompressorApp:
         self.input_pdf_path = tk.StringVar()
         self.output_pdf_path = tk.StringVar()
         self.compression_level = tk.StringVar(value='ebook') # Default compression level
-        self.ghostscript_path = self.find_ghostscript()
+        self.gs_proc = None # Running Ghostscript process, if any
+        self._gs_err = None # Temp file that collects Ghostscript's stderr
+        self._input_stem = '' # Input file name without directory or extension
+        self._size_before = 0 # Input file size in bytes, captured before compressing
+        self._size_after = 0 # Output file size in bytes, captured once Ghostscript exits
+        self.ghostscript_path = self._load_cached_gs_path()
+        if not self.ghostscript_path:
+            self.ghostscript_path = self.find_ghostscript()
+            if self.ghostscript_path:
+                self._save_gs_path(self.ghostscript_path)
 
         # --- UI Setup ---
         self.create_widgets()
@@ -39,40 +95,128 @@ class PDFCompressorApp:
         if not self.ghostscript_path:
             self.show_ghostscript_warning()
 
+    def _gs_cache_file(self):
+        """
+        Returns the path of the file used to cache the Ghostscript location,
+        or None if no suitable per-user data directory is available.
+        """
+        local_app_data = os.environ.get('LOCALAPPDATA')
+        if not local_app_data:
+            return None
+        return os.path.join(local_app_data, 'PDFCompressor', 'gs.json')
+
+    def _load_cached_gs_path(self):
+        """
+        Returns the Ghostscript path saved by a previous launch, as long as
+        the executable still exists. Returns None on a cache miss.
+        """
+        cache_file = self._gs_cache_file()
+        if not cache_file:
+            return None
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                path = json.load(f).get('ghostscript_path')
+        except (OSError, ValueError, AttributeError):
+            return None
+        if isinstance(path, str) and os.path.isfile(path):
+            return path
+        return None
+
+    def _save_gs_path(self, path):
+        """
+        Saves the resolved Ghostscript path so later launches can skip the scan.
+        Failing to write the cache is not an error.
+        """
+        cache_file = self._gs_cache_file()
+        if not cache_file:
+            return
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'ghostscript_path': path}, f)
+        except OSError:
+            pass
+
     def find_ghostscript(self):
         """
-        Attempts to find the Ghostscript executable on Windows.
-        Checks common installation directories and the system PATH.
+        Attempts to find the Ghostscript executable.
+        On Windows, checks the system PATH and common installation directories;
+        elsewhere Ghostscript is installed as 'gs' on the PATH.
         """
-        # Common names for the Ghostscript command-line executable
-        gs_names = ['gswin64c.exe', 'gswin32c.exe', 'gs.exe']
-        
-        # Check if it's in the system PATH
-        for name in gs_names:
-            if sys.platform == 'win32':
-                try:
-                    # Use 'where' command on Windows to find the executable
-                    path = subprocess.check_output(['where', name]).strip().decode()
-                    if os.path.exists(path):
-                        return path
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    continue
-
-        # Check common installation directories
-        program_files = os.environ.get('ProgramFiles', 'C:\\Program Files')
-        gs_dirs = [os.path.join(program_files, 'gs')]
-        for gs_dir in gs_dirs:
-            if os.path.isdir(gs_dir):
-                for root, _, files in os.walk(gs_dir):
-                    for name in gs_names:
-                        if name in files:
-                            return os.path.join(root, name)
+        if sys.platform != 'win32':
+            return shutil.which('gs')
+
+        # Check if it's in the system PATH. Each directory is visited once and
+        # probed for every name, rather than walking PATH once per name, and
+        # no 'where' (and console host) process is spawned.
+        for path_dir in os.environ.get('PATH', '').split(os.pathsep):
+            if not path_dir:
+                continue
+            for name in GS_NAMES:
+                path = os.path.join(path_dir, name)
+                if os.path.isfile(path):
+                    return path
+
+        # Check common installation directories. Ghostscript installs to
+        # <Program Files>\gs\gs<version>\bin, so match that layout directly
+        # instead of walking the whole tree.
+        program_dirs = []
+        for var, default in (('ProgramFiles', 'C:\\Program Files'),
+                             ('ProgramW6432', None),
+                             ('ProgramFiles(x86)', None)):
+            program_dir = os.environ.get(var, default)
+            if program_dir and program_dir not in program_dirs:
+                program_dirs.append(program_dir)
+
+        for program_dir in program_dirs:
+            gs_dir = os.path.join(program_dir, 'gs')
+            for name in ('gswin64c.exe', 'gswin32c.exe'):
+                hits = glob.glob(os.path.join(gs_dir, 'gs*', 'bin', name))
+                if hits:
+                    return max(hits, key=self._gs_version_key)
+
+            # Fall back to searching the whole tree for unusual layouts
+            path = self._scan_for_ghostscript(gs_dir, GS_NAMES)
+            if path:
+                return path
+        return None
+
+    def _gs_version_key(self, exe_path):
+        """
+        Returns a sortable version tuple parsed from the gs<version> directory
+        of a <gs_dir>\\gs<version>\\bin\\<exe> path, e.g. (10, 2, 1) for gs10.02.1.
+        Compares numerically so gs10.x ranks above gs9.x.
+        """
+        version_dir = os.path.basename(os.path.dirname(os.path.dirname(exe_path)))
+        return tuple(int(part) for part in re.findall(r'\d+', version_dir))
+
+    def _scan_for_ghostscript(self, gs_dir, gs_names):
+        """
+        Breadth-first search of gs_dir for any of the given executable names.
+        Uses os.scandir so file type checks come from the directory listing
+        without an extra stat per entry.
+        """
+        gs_names_set = frozenset(gs_names)
+        pending = deque([gs_dir])
+        while pending:
+            current = pending.popleft()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name in gs_names_set and entry.is_file(follow_symlinks=False):
+                            return entry.path
+            except OSError:
+                continue
         return None
 
     def show_ghostscript_warning(self):
         """
         Displays a warning message if Ghostscript is not found and provides a link.
         """
+        from tkinter import messagebox
+
         messagebox.showwarning(
             "Ghostscript Not Found",
             "Ghostscript is required for PDF compression but could not be found.\n\n"
@@ -98,15 +242,7 @@ class PDFCompressorApp:
         compression_frame = ttk.LabelFrame(main_frame, text="2. Choose Compression Level", padding="10")
         compression_frame.pack(fill=tk.X, pady=10)
 
-        # Descriptions for each level
-        levels = {
-            "screen": "Low Quality (72 dpi) - Max Compression",
-            "ebook": "Medium Quality (150 dpi) - Good for screen reading",
-            "printer": "High Quality (300 dpi) - Good for printing",
-            "prepress": "Best Quality (300 dpi, preserves color) - Minimal Compression"
-        }
-        
-        for value, text in levels.items():
+        for value, text in COMPRESSION_LEVELS:
             ttk.Radiobutton(
                 compression_frame,
                 text=text,
@@ -121,28 +257,36 @@ class PDFCompressorApp:
         self.compress_button = ttk.Button(action_frame, text="Compress PDF", command=self.start_compression_thread)
         self.compress_button.pack(pady=10)
         
-        self.progress = ttk.Progressbar(action_frame, orient=tk.HORIZONTAL, length=300, mode='indeterminate')
+        self.progress = ttk.Progressbar(action_frame, orient=tk.HORIZONTAL, length=300, mode='determinate', maximum=100)
         self.status_label = ttk.Label(action_frame, text="Ready. Select a file to begin.")
+        # Shows the result of the last compression without a modal dialog
+        self.summary_label = ttk.Label(action_frame, text="")
         
         self.progress.pack_forget() # Hide until needed
         self.status_label.pack(pady=5)
+        self.summary_label.pack()
 
     def select_input_file(self):
         """
         Opens a file dialog to select the input PDF file.
         """
+        from tkinter import filedialog
+
         filepath = filedialog.askopenfilename(
             title="Select a PDF file",
             filetypes=[("PDF Files", "*.pdf")]
         )
         if filepath:
             self.input_pdf_path.set(filepath)
+            self._input_stem = os.path.splitext(os.path.basename(filepath))[0]
             self.status_label.config(text=f"Selected: {os.path.basename(filepath)}")
 
     def start_compression_thread(self):
         """
-        Starts the compression process in a separate thread to keep the UI responsive.
+        Validates the inputs, asks for a save location and starts the compression.
         """
+        from tkinter import filedialog, messagebox
+
         # Validate inputs before starting
         if not self.input_pdf_path.get():
             messagebox.showerror("Error", "Please select an input PDF file first.")
@@ -157,7 +301,7 @@ class PDFCompressorApp:
             title="Save Compressed PDF As...",
             filetypes=[("PDF Files", "*.pdf")],
             defaultextension=".pdf",
-            initialfile=f"{os.path.splitext(os.path.basename(self.input_pdf_path.get()))[0]}_compressed.pdf"
+            initialfile=f"{self._input_stem}_compressed.pdf"
         )
 
         if not output_path:
@@ -165,88 +309,177 @@ class PDFCompressorApp:
             return
 
         self.output_pdf_path.set(output_path)
+
+        try:
+            self._size_before = os.path.getsize(self.input_pdf_path.get())
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not read the input PDF file:\n\n{e}")
+            return
         
         # Disable button and show progress bar
         self.compress_button.config(state=tk.DISABLED)
         self.status_label.config(text="Compressing... Please wait.")
+        self.summary_label.config(text="")
+        self.progress['value'] = 0
         self.progress.pack(pady=5)
-        self.progress.start()
-        
-        # Run compression in a background thread
-        compression_thread = threading.Thread(
-            target=self.run_compression,
-            daemon=True
-        )
-        compression_thread.start()
+
+        self.run_compression()
 
     def run_compression(self):
         """
-        Executes the Ghostscript command to perform the PDF compression.
-        This method is designed to be run in a background thread.
+        Launches Ghostscript to perform the PDF compression.
+        The process runs without blocking the UI; _poll_gs picks up the result.
         """
-        input_file = self.input_pdf_path.get()
-        output_file = self.output_pdf_path.get()
+        input_file = self._extended_length_path(self.input_pdf_path.get())
+        output_file = self._extended_length_path(self.output_pdf_path.get())
         level = self.compression_level.get()
 
+        # On POSIX the file paths are passed as bytes, which subprocess hands to
+        # exec as-is; Windows needs str because CreateProcessW takes wide strings
+        if os.name == 'posix':
+            output_arg = b'-sOutputFile=' + os.fsencode(output_file)
+            input_arg = os.fsencode(input_file)
+        else:
+            output_arg = f'-sOutputFile={output_file}'
+            input_arg = input_file
+
         # Ghostscript command arguments
         command = [
             self.ghostscript_path,
-            '-sDEVICE=pdfwrite',
-            '-dCompatibilityLevel=1.4',
+            *self._GS_STATIC_ARGS,
+            *self._GS_PERFORMANCE_ARGS,
             f'-dPDFSETTINGS=/{level}',
-            '-dNOPAUSE',
-            '-dQUIET',
-            '-dBATCH',
-            f'-sOutputFile={output_file}',
-            input_file
+            output_arg,
+            input_arg
         ]
 
+        # stdout is never read, and stderr goes to a temp file rather than a
+        # pipe so a noisy Ghostscript run can't fill the pipe buffer and hang
+        self._gs_err = tempfile.TemporaryFile()
         try:
-            # Using PIPE for stdout/stderr to keep the console clean
-            process = subprocess.run(
+            self.gs_proc = subprocess.Popen(
                 command,
-                check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+                stdout=subprocess.DEVNULL,
+                stderr=self._gs_err,
+                creationflags=self._CREATION_FLAGS
             )
-            
-            # After successful compression, update UI from the main thread
-            self.root.after(0, self.on_compression_success)
-
-        except subprocess.CalledProcessError as e:
-            error_message = f"Ghostscript Error:\n{e.stderr.decode('utf-8', 'ignore')}"
-            self.root.after(0, self.on_compression_error, error_message)
         except Exception as e:
-            self.root.after(0, self.on_compression_error, str(e))
+            self._gs_err.close()
+            self._gs_err = None
+            self.on_compression_error(str(e))
+            return
+
+        self.root.after(self._POLL_INTERVAL_MS, self._poll_gs)
+
+    def _extended_length_path(self, path):
+        """
+        On Windows, returns path with the \\\\?\\ prefix when it is long or
+        contains non-ASCII characters, so Ghostscript can open it past MAX_PATH
+        without the usual path normalization. Other paths are returned as-is.
+        """
+        if sys.platform != 'win32' or (len(path) <= 240 and path.isascii()):
+            return path
+        path = os.path.abspath(path)
+        if path.startswith('\\\\?\\'):
+            return path
+        if path.startswith('\\\\'):
+            # UNC path: \\server\share -> \\?\UNC\server\share
+            return '\\\\?\\UNC\\' + path[2:]
+        return '\\\\?\\' + path
+
+    def _poll_gs(self):
+        """
+        Checks whether Ghostscript has finished, rescheduling itself until it has.
+        Runs on the Tk event loop, so the UI can be updated directly.
+        """
+        returncode = self.gs_proc.poll()
+        if returncode is None:
+            # Reschedule first so a progress update can never stop the polling
+            self.root.after(self._POLL_INTERVAL_MS, self._poll_gs)
+            self._update_progress()
+            return
+
+        self.gs_proc = None
+        err_tmp, self._gs_err = self._gs_err, None
+        with err_tmp:
+            if returncode == 0:
+                try:
+                    self._size_after = os.path.getsize(self.output_pdf_path.get())
+                    error_message = None
+                except OSError as e:
+                    error_message = str(e)
+            else:
+                error_message = f"Ghostscript Error:\n{self._read_stderr_tail(err_tmp)}"
+
+        if error_message is None:
+            self.on_compression_success()
+        else:
+            self.on_compression_error(error_message)
+
+    def _read_stderr_tail(self, err_tmp):
+        """
+        Returns the last _STDERR_TAIL_BYTES of Ghostscript's stderr as text,
+        so a run that printed megabytes before failing isn't decoded in full.
+        """
+        err_tmp.seek(0, os.SEEK_END)
+        size = err_tmp.tell()
+        err_tmp.seek(max(0, size - self._STDERR_TAIL_BYTES))
+        tail = err_tmp.read().decode('utf-8', 'ignore')
+        if size > self._STDERR_TAIL_BYTES:
+            tail = "... (truncated)\n" + tail
+        return tail
+
+    def _update_progress(self):
+        """
+        Estimates progress from how much of the output file Ghostscript has
+        written so far, relative to the size expected for the chosen level.
+        """
+        expected_size = self._size_before * self._EXPECTED_RATIO.get(self.compression_level.get(), 1.0)
+        if expected_size <= 0:
+            return
+        try:
+            written = os.path.getsize(self.output_pdf_path.get())
+        except OSError:
+            # Not created yet, or briefly unavailable; try again next poll
+            return
+        # Stay below 100% until Ghostscript actually exits
+        self.progress['value'] = min(99, 100 * written / expected_size)
 
     def on_compression_success(self):
         """
         Callback function to update the UI after successful compression.
         """
-        self.progress.stop()
         self.progress.pack_forget()
         self.compress_button.config(state=tk.NORMAL)
-        self.status_label.config(text="Compression successful!")
         
-        original_size = os.path.getsize(self.input_pdf_path.get()) / (1024 * 1024)
-        compressed_size = os.path.getsize(self.output_pdf_path.get()) / (1024 * 1024)
+        original_size = self._size_before / (1024 * 1024)
+        compressed_size = self._size_after / (1024 * 1024)
         reduction = 100 - (compressed_size / original_size * 100)
         
-        messagebox.showinfo(
-            "Success",
-            f"PDF compressed successfully!\n\n"
-            f"Original Size: {original_size:.2f} MB\n"
-            f"Compressed Size: {compressed_size:.2f} MB\n"
-            f"Reduction: {reduction:.1f}%"
+        self.summary_label.config(
+            text=f"Done: {original_size:.2f} MB \u2192 {compressed_size:.2f} MB ({reduction:.1f}% smaller)"
         )
         self.status_label.config(text="Ready.")
+        # Return focus to the button so another file can be compressed right away
+        self.compress_button.focus_set()
+
+        if self.verbose:
+            from tkinter import messagebox
+
+            messagebox.showinfo(
+                "Success",
+                f"PDF compressed successfully!\n\n"
+                f"Original Size: {original_size:.2f} MB\n"
+                f"Compressed Size: {compressed_size:.2f} MB\n"
+                f"Reduction: {reduction:.1f}%"
+            )
 
     def on_compression_error(self, error_message):
         """
         Callback function to update the UI after a compression error.
         """
-        self.progress.stop()
+        from tkinter import messagebox
+
         self.progress.pack_forget()
         self.compress_button.config(state=tk.NORMAL)
         self.status_label.config(text="An error occurred.")
@@ -256,5 +489,5 @@ class PDFCompressorApp:
 # --- Main Execution ---
 if __name__ == "__main__":
     root = tk.Tk()
-    app = PDFCompressorApp(root)
+    app = PDFCompressorApp(root, verbose='--verbose' in sys.argv[1:])
     root.mainloop()